@@ -1,8 +1,7 @@
 import asyncio
 import contextlib
-import sys
 from collections.abc import AsyncGenerator, Iterable
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from apluggy.stack.aexit import patch_aexit
 
@@ -23,7 +22,7 @@ async def async_stack_gen_ctxs(
     '''
     ctxs = list(ctxs)
 
-    entered = set[AGenCtxMngr[T]]()
+    entered: set[AGenCtxMngr[T]] = set()
 
     async def _enter(ctx: AGenCtxMngr[T]) -> T:
         y = await ctx.__aenter__()
@@ -68,21 +67,23 @@ async def async_stack_gen_ctxs(
 
                     pass
 
-        except BaseException:
-            exc_info = sys.exc_info()
+        except BaseException as e:
+            exc: Optional[BaseException] = e
         else:
-            exc_info = (None, None, None)
+            exc = None
         finally:
             # Exit the async context managers sequentially in the reverse order.
             for ctx in reversed(ctxs):
                 if ctx not in entered:
                     continue
                 try:
-                    if await ctx.__aexit__(*exc_info):
-                        exc_info = (None, None, None)
-                except BaseException:
-                    exc_info = sys.exc_info()
-
-            if isinstance(exc_info[1], BaseException):
+                    if exc is None:
+                        await ctx.__aexit__(None, None, None)
+                    elif await ctx.__aexit__(type(exc), exc, exc.__traceback__):
+                        exc = None
+                except BaseException as e:
+                    exc = e
+
+            if exc is not None:
                 # An exception is unhandled after all async context managers have exited.
-                raise exc_info[1].with_traceback(exc_info[2])
+                raise exc
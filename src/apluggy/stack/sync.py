@@ -1,7 +1,6 @@
 import contextlib
-import sys
 from collections.abc import Generator, Iterable
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from .types import GenCtxMngr
 
@@ -90,7 +89,7 @@ def stack_gen_ctxs(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any
 
     try:
         # Append a context manager as it is entered and remove one as it is exited.
-        entered = list[GenCtxMngr]()
+        entered: list[GenCtxMngr] = []
 
         ys = []
         for ctx in ctxs:
@@ -112,21 +111,23 @@ def stack_gen_ctxs(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any
                 # A context manager exited.
                 pass
 
-    except BaseException:
-        exc_info = sys.exc_info()
+    except BaseException as e:
+        exc: Optional[BaseException] = e
     else:
-        exc_info = (None, None, None)
+        exc = None
     finally:
         # Exit the entered context managers from the innermost to the outermost.
         while entered:
             ctx = entered.pop()
             try:
-                if ctx.__exit__(*exc_info):
+                if exc is None:
+                    ctx.__exit__(None, None, None)
+                elif ctx.__exit__(type(exc), exc, exc.__traceback__):
                     # The exception is handled.
-                    exc_info = (None, None, None)
-            except BaseException:  # A new or the same exception is raised.
-                exc_info = sys.exc_info()
+                    exc = None
+            except BaseException as e:  # A new or the same exception is raised.
+                exc = e
 
-        if isinstance(exc_info[1], BaseException):
+        if exc is not None:
             # An exception is unhandled after all context managers have exited.
-            raise exc_info[1].with_traceback(exc_info[2])
+            raise exc
@@ -32,7 +32,7 @@ class With:
         def call(*args: Any, **kwargs: Any) -> GenCtxMngr[list]:
             ctxs = hook(*args, **kwargs)
             if self.reverse:
-                ctxs = list(reversed(ctxs))
+                ctxs = ctxs[::-1]
             return stack_gen_ctxs(ctxs)
 
         return call
@@ -49,7 +49,7 @@ class AWith:
         def call(*args: Any, **kwargs: Any) -> AGenCtxMngr[list]:
             ctxs = hook(*args, **kwargs)
             if self.reverse:
-                ctxs = list(reversed(ctxs))
+                ctxs = ctxs[::-1]
 
             # TODO: Make `sequential` configurable.  It is set to `True` for
             # now because nextline-graphql doesn't work with `False`.
@@ -0,0 +1,10 @@
+import os
+
+from hypothesis import settings
+
+# Select a profile with the environment variable `HYPOTHESIS_PROFILE`. The
+# default `ci` profile keeps the runs short. `HYPOTHESIS_PROFILE=full pytest`
+# runs the larger sweep.
+settings.register_profile('ci', max_examples=50)
+settings.register_profile('full', max_examples=200)
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'ci'))
@@ -67,7 +67,7 @@ def test_name(pm: PluginManager):
     assert [n for n, _ in pm.list_name_plugin()] == expected
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def pm():
     _pm = PluginManager('myproject')
     _pm.add_hookspecs(spec)
@@ -8,6 +8,9 @@ from hypothesis import strategies as st
 from apluggy.stack import patch_aexit
 from tests.utils import RecordReturns, ReplayReturns, st_none_or
 
+_ST_WITH_ACTION = st_none_or(st.sampled_from(('send', 'throw', 'close')))
+_ST_CTX_ACTION = st_none_or(st.sampled_from(('raise', 'yield')))
+
 
 @given(st.data())
 async def test_patch_aexit(data: st.DataObject) -> None:
@@ -20,20 +23,17 @@ async def test_patch_aexit(data: st.DataObject) -> None:
     '''
     exc = Exception('exc')
 
-    st_with_action = st_none_or(st.sampled_from(['send', 'throw', 'close']))
-    st_ctx_action = st_none_or(st.sampled_from(['raise', 'yield']))
-
     # Develop the expectation with a context manager
     @contextlib.contextmanager
     def ctx(draw: st.DrawFn) -> Generator[str, None, None]:
         yield 'foo'
         # TODO: When Python 3.9 support is dropped
-        # match draw(st_ctx_action):
+        # match draw(_ST_CTX_ACTION):
         #     case 'raise':
         #         raise exc
         #     case 'yield':
         #         yield 'bar'
-        action = draw(st_ctx_action)
+        action = draw(_ST_CTX_ACTION)
         if action == 'raise':
             raise exc
         elif action == 'yield':
@@ -44,14 +44,14 @@ async def test_patch_aexit(data: st.DataObject) -> None:
         with (c := ctx(draw)) as x:
             assert x == 'foo'
             # TODO: When Python 3.9 support is dropped
-            # match draw(st_with_action):
+            # match draw(_ST_WITH_ACTION):
             #     case 'send':
             #         c.gen.send('sent')
             #     case 'throw':
             #         c.gen.throw(exc)
             #     case 'close':
             #         c.gen.close()
-            action = draw(st_with_action)
+            action = draw(_ST_WITH_ACTION)
             if action == 'send':
                 c.gen.send('sent')
             elif action == 'throw':
@@ -68,12 +68,12 @@ async def test_patch_aexit(data: st.DataObject) -> None:
     async def actx(draw: st.DrawFn) -> AsyncGenerator[str, None]:
         yield 'foo'
         # TODO: When Python 3.9 support is dropped
-        # match draw(st_ctx_action):
+        # match draw(_ST_CTX_ACTION):
         #     case 'raise':
         #         raise exc
         #     case 'yield':
         #         yield 'bar'
-        action = draw(st_ctx_action)
+        action = draw(_ST_CTX_ACTION)
         if action == 'raise':
             raise exc
         elif action == 'yield':
@@ -90,22 +90,22 @@ async def test_patch_aexit(data: st.DataObject) -> None:
             try:
                 assert x == 'foo'
                 # TODO: When Python 3.9 support is dropped
-                # match draw(st_with_action):
+                # match draw(_ST_WITH_ACTION):
                 #     case 'send':
                 #         await ac.gen.asend('sent')
                 #     case 'throw':
                 #         await ac.gen.athrow(exc)
                 #     case 'close':
                 #         await ac.gen.aclose()
-                action = draw(st_with_action)
+                action = draw(_ST_WITH_ACTION)
                 if action == 'send':
                     await ac.gen.asend('sent')
                 elif action == 'throw':
                     await ac.gen.athrow(exc)
                 elif action == 'close':
                     await ac.gen.aclose()
-            except Exception:
-                if not await ac.__aexit__(*sys.exc_info()):
+            except Exception as e:
+                if not await ac.__aexit__(type(e), e, e.__traceback__):
                     raise
             else:
                 await ac.__aexit__(None, None, None)
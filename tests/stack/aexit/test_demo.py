@@ -76,8 +76,8 @@ async def test_demo_aexit_problem() -> None:
             except Exception as e:
                 assert e is exc
                 raise
-        except Exception:
-            if not await ac.__aexit__(*sys.exc_info()):
+        except Exception as e:
+            if not await ac.__aexit__(type(e), e, e.__traceback__):
                 raise
         else:
             await ac.__aexit__(None, None, None)
@@ -1,7 +1,6 @@
 import asyncio
 import contextlib
-import sys
-from collections.abc import AsyncGenerator, Iterable
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
 from typing import Any, TypeVar
 
 from apluggy.stack import patch_aexit
@@ -17,206 +16,204 @@ def dunder_enter(
     sequential: bool = False,
 ) -> AGenCtxMngr[list[T]]:
     ctxs = list(ctxs)
-    # TODO: When Python 3.9 support is dropped
-    # match len(ctxs):
-    #     case 0:
-    #         return dunder_enter_null(ctxs)
-    #     case 1:
-    #         return dunder_enter_single(ctxs, fix_reraise=fix_reraise)
-    #     case 2:
-    #         return dunder_enter_double(
-    #             ctxs, fix_reraise=fix_reraise, sequential=sequential
-    #         )
-    #     case 3:
-    #         return dunder_enter_triple(
-    #             ctxs, fix_reraise=fix_reraise, sequential=sequential
-    #         )
-    #     case _:
-    #         raise NotImplementedError()
-    if not ctxs:
-        return dunder_enter_null(ctxs)
-    if len(ctxs) == 1:
-        return dunder_enter_single(ctxs, fix_reraise=fix_reraise)
-    if len(ctxs) == 2:
-        return dunder_enter_double(
-            ctxs, fix_reraise=fix_reraise, sequential=sequential
-        )
-    if len(ctxs) == 3:
-        return dunder_enter_triple(
-            ctxs, fix_reraise=fix_reraise, sequential=sequential
-        )
-    raise NotImplementedError()
+    try:
+        imp = _DUNDER_TABLE[len(ctxs)]
+    except IndexError:
+        raise NotImplementedError() from None
+    return imp(ctxs, fix_reraise=fix_reraise, sequential=sequential)
 
 
 @contextlib.asynccontextmanager
 async def dunder_enter_null(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
+    fix_reraise: bool,
+    sequential: bool = False,
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert not ctxs
+    '''Stack no context managers; `ctxs` must be empty.'''
+    del fix_reraise, sequential
     yield []
 
 
 @contextlib.asynccontextmanager
 async def dunder_enter_single(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
     fix_reraise: bool,
+    sequential: bool = False,
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 1
+    '''Stack `ctxs`, which must hold exactly one context manager.'''
+    del sequential
     ctx = ctxs[0]
     y = await ctx.__aenter__()
-    with patch_aexit(ctx) if fix_reraise else contextlib.nullcontext():
+    try:
+        sent = yield [y]
         try:
-            sent = yield [y]
+            while True:
+                sent = yield [await ctx.gen.asend(sent)]
+        except StopAsyncIteration:
+            pass
+    except BaseException as e:
+        if not await _aexit(ctx, e, fix_reraise):
+            raise
+    else:
+        await ctx.__aexit__(None, None, None)
+
+
+@contextlib.asynccontextmanager
+async def dunder_enter_double(
+    ctxs: Sequence[AGenCtxMngr[T]],
+    fix_reraise: bool,
+    sequential: bool = False,
+) -> AsyncGenerator[list[T], Any]:
+    '''Stack `ctxs`, which must hold exactly two context managers.'''
+    ctx0, ctx1 = ctxs
+    entered0 = entered1 = False
+
+    async def _enter0() -> T:
+        nonlocal entered0
+        y = await ctx0.__aenter__()
+        entered0 = True
+        return y
+
+    async def _enter1() -> T:
+        nonlocal entered1
+        y = await ctx1.__aenter__()
+        entered1 = True
+        return y
+
+    try:
+        try:
+            if sequential:
+                ys = [await _enter0(), await _enter1()]
+            else:
+                ys = list(await asyncio.gather(_enter0(), _enter1()))
+            asend0, asend1 = ctx0.gen.asend, ctx1.gen.asend
+            gather = asyncio.gather
+            sent = yield ys
             try:
                 while True:
-                    sent = yield [await ctx.gen.asend(sent)]
+                    if sequential:
+                        ys = [await asend1(sent), await asend0(sent)]
+                    else:
+                        ys = list(await gather(asend1(sent), asend0(sent)))
+                    sent = yield ys
             except StopAsyncIteration:
                 pass
-        except BaseException:
-            if not await ctx.__aexit__(*sys.exc_info()):
+        except BaseException as e:
+            if not entered1:
+                raise
+            if not await _aexit(ctx1, e, fix_reraise):
                 raise
         else:
-            await ctx.__aexit__(None, None, None)
+            if entered1:
+                await ctx1.__aexit__(None, None, None)
+    except BaseException as e:
+        if not entered0:
+            raise
+        if not await _aexit(ctx0, e, fix_reraise):
+            raise
+    else:
+        if entered0:
+            await ctx0.__aexit__(None, None, None)
 
 
 @contextlib.asynccontextmanager
-async def dunder_enter_double(
-    ctxs: Iterable[AGenCtxMngr[T]],
+async def dunder_enter_triple(  # noqa: C901
+    ctxs: Sequence[AGenCtxMngr[T]],
     fix_reraise: bool,
     sequential: bool = False,
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 2
-    ctx0, ctx1 = ctxs
-    entered = set[AGenCtxMngr[T]]()
+    '''Stack `ctxs`, which must hold exactly three context managers.'''
+    ctx0, ctx1, ctx2 = ctxs
+    entered0 = entered1 = entered2 = False
+
+    async def _enter0() -> T:
+        nonlocal entered0
+        y = await ctx0.__aenter__()
+        entered0 = True
+        return y
+
+    async def _enter1() -> T:
+        nonlocal entered1
+        y = await ctx1.__aenter__()
+        entered1 = True
+        return y
 
-    async def _enter(ctx: AGenCtxMngr[T]) -> T:
-        y = await ctx.__aenter__()
-        entered.add(ctx)
+    async def _enter2() -> T:
+        nonlocal entered2
+        y = await ctx2.__aenter__()
+        entered2 = True
         return y
 
-    with contextlib.ExitStack() as stack:
-        if fix_reraise:
-            stack.enter_context(patch_aexit(ctx0))
-            stack.enter_context(patch_aexit(ctx1))
+    try:
         try:
             try:
                 if sequential:
-                    ys = [await _enter(ctx0), await _enter(ctx1)]
+                    ys = [await _enter0(), await _enter1(), await _enter2()]
                 else:
-                    ys = list(await asyncio.gather(_enter(ctx0), _enter(ctx1)))
+                    ys = list(await asyncio.gather(_enter0(), _enter1(), _enter2()))
+                asend0 = ctx0.gen.asend
+                asend1 = ctx1.gen.asend
+                asend2 = ctx2.gen.asend
+                gather = asyncio.gather
                 sent = yield ys
                 try:
                     while True:
                         if sequential:
                             ys = [
-                                await ctx1.gen.asend(sent),
-                                await ctx0.gen.asend(sent),
+                                await asend2(sent),
+                                await asend1(sent),
+                                await asend0(sent),
                             ]
                         else:
                             ys = list(
-                                await asyncio.gather(
-                                    ctx1.gen.asend(sent),
-                                    ctx0.gen.asend(sent),
-                                )
+                                await gather(asend2(sent), asend1(sent), asend0(sent))
                             )
                         sent = yield ys
                 except StopAsyncIteration:
                     pass
-            except BaseException:
-                if ctx1 not in entered:
+            except BaseException as e:
+                if not entered2:
                     raise
-                if not await ctx1.__aexit__(*sys.exc_info()):
+                if not await _aexit(ctx2, e, fix_reraise):
                     raise
             else:
-                if ctx1 in entered:
-                    await ctx1.__aexit__(None, None, None)
-        except BaseException:
-            if ctx0 not in entered:
+                if entered2:
+                    await ctx2.__aexit__(None, None, None)
+        except BaseException as e:
+            if not entered1:
                 raise
-            if not await ctx0.__aexit__(*sys.exc_info()):
+            if not await _aexit(ctx1, e, fix_reraise):
                 raise
         else:
-            if ctx0 in entered:
-                await ctx0.__aexit__(None, None, None)
-
-
-@contextlib.asynccontextmanager
-async def dunder_enter_triple(  # noqa: C901
-    ctxs: Iterable[AGenCtxMngr[T]],
-    fix_reraise: bool,
-    sequential: bool = False,
-) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 3
-    ctx0, ctx1, ctx2 = ctxs
-    entered = set[AGenCtxMngr[T]]()
-
-    async def _enter(ctx: AGenCtxMngr[T]) -> T:
-        y = await ctx.__aenter__()
-        entered.add(ctx)
-        return y
-
-    with contextlib.ExitStack() as stack:
-        if fix_reraise:
-            stack.enter_context(patch_aexit(ctx0))
-            stack.enter_context(patch_aexit(ctx1))
-            stack.enter_context(patch_aexit(ctx2))
-        try:
-            try:
-                try:
-                    if sequential:
-                        ys = [
-                            await _enter(ctx0),
-                            await _enter(ctx1),
-                            await _enter(ctx2),
-                        ]
-                    else:
-                        ys = list(
-                            await asyncio.gather(
-                                _enter(ctx0), _enter(ctx1), _enter(ctx2)
-                            )
-                        )
-                    sent = yield ys
-                    try:
-                        while True:
-                            if sequential:
-                                ys = [
-                                    await ctx2.gen.asend(sent),
-                                    await ctx1.gen.asend(sent),
-                                    await ctx0.gen.asend(sent),
-                                ]
-                            else:
-                                ys = list(
-                                    await asyncio.gather(
-                                        ctx2.gen.asend(sent),
-                                        ctx1.gen.asend(sent),
-                                        ctx0.gen.asend(sent),
-                                    )
-                                )
-                            sent = yield ys
-                    except StopAsyncIteration:
-                        pass
-                except BaseException:
-                    if ctx2 not in entered:
-                        raise
-                    if not await ctx2.__aexit__(*sys.exc_info()):
-                        raise
-                else:
-                    if ctx2 in entered:
-                        await ctx2.__aexit__(None, None, None)
-            except BaseException:
-                if ctx1 not in entered:
-                    raise
-                if not await ctx1.__aexit__(*sys.exc_info()):
-                    raise
-            else:
-                if ctx1 in entered:
-                    await ctx1.__aexit__(None, None, None)
-        except BaseException:
-            if ctx0 not in entered:
-                raise
-            if not await ctx0.__aexit__(*sys.exc_info()):
-                raise
+            if entered1:
+                await ctx1.__aexit__(None, None, None)
+    except BaseException as e:
+        if not entered0:
+            raise
+        if not await _aexit(ctx0, e, fix_reraise):
+            raise
+    else:
+        if entered0:
+            await ctx0.__aexit__(None, None, None)
+
+
+async def _aexit(ctx: AGenCtxMngr[T], exc: BaseException, fix_reraise: bool) -> bool:
+    '''Exit `ctx` with `exc`, patched with `patch_aexit()` if `fix_reraise`.
+
+    The patch only matters when `__aexit__()` throws into the generator. It
+    is, therefore, not applied when the context exits without an exception.
+    '''
+    if not fix_reraise:
+        return bool(await ctx.__aexit__(type(exc), exc, exc.__traceback__))
+    with patch_aexit(ctx):
+        return bool(await ctx.__aexit__(type(exc), exc, exc.__traceback__))
+
+
+# Indexed by the number of the context managers. Every entry takes the same
+# arguments so that `dunder_enter()` can forward them without branching.
+_DUNDER_TABLE: tuple[Callable[..., AGenCtxMngr[list[Any]]], ...] = (
+    dunder_enter_null,
+    dunder_enter_single,
+    dunder_enter_double,
+    dunder_enter_triple,
+)
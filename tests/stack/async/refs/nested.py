@@ -1,5 +1,5 @@
 import contextlib
-from collections.abc import AsyncGenerator, Iterable
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
 from typing import Any, TypeVar
 
 from .types import AGenCtxMngr
@@ -9,44 +9,26 @@ T = TypeVar('T')
 
 def nested_with(ctxs: Iterable[AGenCtxMngr[T]]) -> AGenCtxMngr[list[T]]:
     ctxs = list(ctxs)
-    # TODO: When Python 3.9 support is dropped
-    # match len(ctxs):
-    #     case 0:
-    #         return nested_with_null(ctxs)
-    #     case 1:
-    #         return nested_with_single(ctxs)
-    #     case 2:
-    #         return nested_with_double(ctxs)
-    #     case 3:
-    #         return nested_with_triple(ctxs)
-    #     case _:
-    #         raise NotImplementedError()
-    if not ctxs:
-        return nested_with_null(ctxs)
-    if len(ctxs) == 1:
-        return nested_with_single(ctxs)
-    if len(ctxs) == 2:
-        return nested_with_double(ctxs)
-    if len(ctxs) == 3:
-        return nested_with_triple(ctxs)
-    raise NotImplementedError()
+    try:
+        imp = _NESTED_TABLE[len(ctxs)]
+    except IndexError:
+        raise NotImplementedError() from None
+    return imp(ctxs)
 
 
 @contextlib.asynccontextmanager
 async def nested_with_null(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert not ctxs
+    '''Stack no context managers; `ctxs` must be empty.'''
     yield []
 
 
 @contextlib.asynccontextmanager
 async def nested_with_single(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 1
+    '''Stack `ctxs`, which must hold exactly one context manager.'''
     ctx = ctxs[0]
     async with ctx as y:
         sent = yield [y]
@@ -59,38 +41,46 @@ async def nested_with_single(
 
 @contextlib.asynccontextmanager
 async def nested_with_double(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 2
+    '''Stack `ctxs`, which must hold exactly two context managers.'''
     ctx0, ctx1 = ctxs
     async with ctx0 as y0, ctx1 as y1:
+        asend0, asend1 = ctx0.gen.asend, ctx1.gen.asend
         sent = yield [y0, y1]
         try:
             while True:
-                sent = yield [
-                    await ctx1.gen.asend(sent),
-                    await ctx0.gen.asend(sent),
-                ]
+                sent = yield [await asend1(sent), await asend0(sent)]
         except StopAsyncIteration:
             pass
 
 
 @contextlib.asynccontextmanager
 async def nested_with_triple(
-    ctxs: Iterable[AGenCtxMngr[T]],
+    ctxs: Sequence[AGenCtxMngr[T]],
 ) -> AsyncGenerator[list[T], Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 3
+    '''Stack `ctxs`, which must hold exactly three context managers.'''
     ctx0, ctx1, ctx2 = ctxs
     async with ctx0 as y0, ctx1 as y1, ctx2 as y2:
+        asend0, asend1, asend2 = ctx0.gen.asend, ctx1.gen.asend, ctx2.gen.asend
         sent = yield [y0, y1, y2]
         try:
             while True:
                 sent = yield [
-                    await ctx2.gen.asend(sent),
-                    await ctx1.gen.asend(sent),
-                    await ctx0.gen.asend(sent),
+                    await asend2(sent),
+                    await asend1(sent),
+                    await asend0(sent),
                 ]
         except StopAsyncIteration:
             pass
+
+
+# Indexed by the number of the context managers
+_NESTED_TABLE: tuple[
+    Callable[[Sequence[AGenCtxMngr[Any]]], AGenCtxMngr[list[Any]]], ...
+] = (
+    nested_with_null,
+    nested_with_single,
+    nested_with_double,
+    nested_with_triple,
+)
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
-from collections.abc import AsyncGenerator, MutableSequence
+import types
+from collections.abc import AsyncGenerator, Generator, MutableSequence
 from typing import Any, TypeVar
 
 from hypothesis import strategies as st
@@ -13,6 +14,13 @@ from .refs import AStack
 
 T = TypeVar('T')
 
+# Strategies are built once and reused by every draw.
+_ST_RAISE = st.booleans()
+_ST_SKIPS = st.integers(min_value=0, max_value=4)
+_ST_CTX_ACTION = st.one_of(st.none(), st.sampled_from(['raise', 'break']))
+_ST_EXCEPT_ACTION = st.sampled_from(['reraise', 'raise'])
+_ST_WITH_ACTION = st.sampled_from(['send', 'throw', 'close'])
+
 
 async def close_gen(gen: AsyncGenerator[Any, Any], max_attempts: int = 10) -> None:
     while True:
@@ -30,9 +38,12 @@ async def close_gen(gen: AsyncGenerator[Any, Any], max_attempts: int = 10) -> No
         break
 
 
-async def async_skips(n: int) -> None:
+@types.coroutine
+def async_skips(n: int) -> Generator[None, None, None]:
+    # A bare yield gives control back to the event loop as `asyncio.sleep(0)`
+    # does, n times within a single await.
     for _ in range(n):
-        await asyncio.sleep(0)
+        yield
 
 
 async def run(
@@ -71,13 +82,13 @@ async def mock_async_context(
 ) -> AsyncGenerator[Any, Any]:
     probe(id, 'init', f'n_sends={n_sends}')
 
-    if draw(st.booleans()):
+    if draw(_ST_RAISE):
         exc = GenRaised(f'{id}-init')
         probe(id, 'raise', f'{exc!r}')
         raise exc
     probe(id)
 
-    n_skips = draw(st.integers(min_value=0, max_value=4))
+    n_skips = draw(_ST_SKIPS)
     probe(id, 'n_skips', n_skips)
     await async_skips(n_skips)
 
@@ -90,11 +101,11 @@ async def mock_async_context(
         for i in range(n_sends):
             ii = f'{i+1}/{n_sends}'
 
-            n_skips = draw(st.integers(min_value=0, max_value=4))
+            n_skips = draw(_ST_SKIPS)
             probe(id, ii, 'n_skips', n_skips)
             await async_skips(n_skips)
 
-            action = draw(st.one_of(st.none(), st.sampled_from(['raise', 'break'])))
+            action = draw(_ST_CTX_ACTION)
             if action == 'raise':
                 exc = GenRaised(f'{id}-{ii}')
                 probe(id, ii, 'raise', f'{exc!r}')
@@ -108,7 +119,7 @@ async def mock_async_context(
             sent = yield y
             probe(id, ii, 'received', f'{sent!r}')
 
-        if draw(st.booleans()):
+        if draw(_ST_RAISE):
             exc = GenRaised(f'{id}-exit')
             probe(id, 'raise', f'{exc!r}')
             raise exc
@@ -120,7 +131,7 @@ async def mock_async_context(
         raise
     except BaseException as e:
         probe(id, 'caught', e)
-        action = draw(st.sampled_from(['reraise', 'raise']))
+        action = draw(_ST_EXCEPT_ACTION)
         if action == 'reraise':
             probe(id, 'reraise')
             raise
@@ -151,7 +162,7 @@ async def run_async_generator_context(
 
         for i in range(n_sends):
             ii = f'{i+1}/{n_sends}'
-            action = draw(st.sampled_from(['send', 'throw', 'close']))
+            action = draw(_ST_WITH_ACTION)
             try:
                 # TODO: When Python 3.9 support is dropped
                 # match action:
@@ -13,7 +13,7 @@ from .runner import run
 
 @mark.skipif(getenv('GITHUB_ACTIONS') == 'true', reason='Fails on GitHub Actions')
 @given(st.data())
-@settings(max_examples=200, phases=(Phase.generate,))  # Avoid shrinking
+@settings(phases=(Phase.generate,))  # Avoid shrinking
 async def test_refs(data: st.DataObject):
     '''Assert reference implementations run in exactly the same way.'''
     n_contexts = data.draw(st.integers(min_value=0, max_value=3), label='n_contexts')
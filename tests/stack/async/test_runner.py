@@ -36,7 +36,7 @@ async def run_mock_async_context(
 
 
 @given(st.data())
-@settings(max_examples=100, deadline=300)
+@settings(deadline=300)
 async def test_mock_context(data: st.DataObject) -> None:
     n_sends = data.draw(st.integers(min_value=0, max_value=4), label='n_sends')
 
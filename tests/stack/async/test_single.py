@@ -58,7 +58,7 @@ async def run_dunder_enter_single(draw: st.DrawFn, n_sends: int):
 
 
 @given(st.data())
-@settings(max_examples=200, deadline=1000)
+@settings(deadline=1000)
 async def test_single(data: st.DataObject):
     n_sends = data.draw(st.integers(min_value=0, max_value=5), label='n_sends')
     draw = RecordReturns(data.draw)
@@ -1,6 +1,5 @@
 import contextlib
-import sys
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Sequence
 from typing import Any, TypeVar
 
 from apluggy.stack import GenCtxMngr
@@ -10,43 +9,21 @@ T = TypeVar('T')
 
 def dunder_enter(ctxs: Iterable[GenCtxMngr[T]]) -> GenCtxMngr[list[T]]:
     ctxs = list(ctxs)
-    # TODO: When Python 3.9 support is dropped
-    # match len(ctxs):
-    #     case 0:
-    #         return dunder_enter_null(ctxs)
-    #     case 1:
-    #         return dunder_enter_single(ctxs)
-    #     case 2:
-    #         return dunder_enter_double(ctxs)
-    #     case 3:
-    #         return dunder_enter_triple(ctxs)
-    #     case 4:
-    #         return dunder_enter_quadruple(ctxs)
-    #     case _:
-    #         raise NotImplementedError()
-    if not ctxs:
-        return dunder_enter_null(ctxs)
-    if len(ctxs) == 1:
-        return dunder_enter_single(ctxs)
-    if len(ctxs) == 2:
-        return dunder_enter_double(ctxs)
-    if len(ctxs) == 3:
-        return dunder_enter_triple(ctxs)
-    if len(ctxs) == 4:
-        return dunder_enter_quadruple(ctxs)
-    raise NotImplementedError()
+    n = len(ctxs)
+    if n >= len(_DUNDER_TABLE):
+        raise NotImplementedError()
+    return _DUNDER_TABLE[n](ctxs)
 
 
 @contextlib.contextmanager
-def dunder_enter_null(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    assert not ctxs
+def dunder_enter_null(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack no context managers; `ctxs` must be empty.'''
     yield []
 
 
 @contextlib.contextmanager
-def dunder_enter_single(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 1
+def dunder_enter_single(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack `ctxs`, which must hold exactly one context manager.'''
     ctx = ctxs[0]
     y = ctx.__enter__()
     try:
@@ -56,8 +33,8 @@ def dunder_enter_single(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any
                 sent = yield [ctx.gen.send(sent)]
         except StopIteration:
             pass
-    except BaseException:
-        if not ctx.__exit__(*sys.exc_info()):
+    except BaseException as e:
+        if not ctx.__exit__(type(e), e, e.__traceback__):
             raise
     else:
         ctx.__exit__(None, None, None)
@@ -65,10 +42,9 @@ def dunder_enter_single(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any
 
 @contextlib.contextmanager
 def dunder_enter_double(  # noqa: C901
-    ctxs: Iterable[GenCtxMngr[T]],
+    ctxs: Sequence[GenCtxMngr[T]],
 ) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 2
+    '''Stack `ctxs`, which must hold exactly two context managers.'''
     ctx0, ctx1 = ctxs
     y0 = ctx0.__enter__()
     try:
@@ -80,22 +56,21 @@ def dunder_enter_double(  # noqa: C901
                     sent = yield [ctx1.gen.send(sent), ctx0.gen.send(sent)]
             except StopIteration:
                 pass
-        except BaseException:
-            if not ctx1.__exit__(*sys.exc_info()):
+        except BaseException as e:
+            if not ctx1.__exit__(type(e), e, e.__traceback__):
                 raise
         else:
             ctx1.__exit__(None, None, None)
-    except BaseException:
-        if not ctx0.__exit__(*sys.exc_info()):
+    except BaseException as e:
+        if not ctx0.__exit__(type(e), e, e.__traceback__):
             raise
     else:
         ctx0.__exit__(None, None, None)
 
 
 @contextlib.contextmanager
-def dunder_enter_triple(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 3
+def dunder_enter_triple(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack `ctxs`, which must hold exactly three context managers.'''
     ctx0, ctx1, ctx2 = ctxs
     y0 = ctx0.__enter__()
     try:
@@ -114,18 +89,18 @@ def dunder_enter_triple(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any
                 except StopIteration:
                     pass
 
-            except BaseException:
-                if not ctx2.__exit__(*sys.exc_info()):
+            except BaseException as e:
+                if not ctx2.__exit__(type(e), e, e.__traceback__):
                     raise
             else:
                 ctx2.__exit__(None, None, None)
-        except BaseException:
-            if not ctx1.__exit__(*sys.exc_info()):
+        except BaseException as e:
+            if not ctx1.__exit__(type(e), e, e.__traceback__):
                 raise
         else:
             ctx1.__exit__(None, None, None)
-    except BaseException:
-        if not ctx0.__exit__(*sys.exc_info()):
+    except BaseException as e:
+        if not ctx0.__exit__(type(e), e, e.__traceback__):
             raise
     else:
         ctx0.__exit__(None, None, None)
@@ -133,10 +108,9 @@ def dunder_enter_triple(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any
 
 @contextlib.contextmanager
 def dunder_enter_quadruple(
-    ctxs: Iterable[GenCtxMngr[T]],
+    ctxs: Sequence[GenCtxMngr[T]],
 ) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 4
+    '''Stack `ctxs`, which must hold exactly four context managers.'''
     ctx0, ctx1, ctx2, ctx3 = ctxs
     y0 = ctx0.__enter__()
     try:
@@ -158,23 +132,35 @@ def dunder_enter_quadruple(
                     except StopIteration:
                         pass
 
-                except BaseException:
-                    if not ctx3.__exit__(*sys.exc_info()):
+                except BaseException as e:
+                    if not ctx3.__exit__(type(e), e, e.__traceback__):
                         raise
                 else:
                     ctx3.__exit__(None, None, None)
-            except BaseException:
-                if not ctx2.__exit__(*sys.exc_info()):
+            except BaseException as e:
+                if not ctx2.__exit__(type(e), e, e.__traceback__):
                     raise
             else:
                 ctx2.__exit__(None, None, None)
-        except BaseException:
-            if not ctx1.__exit__(*sys.exc_info()):
+        except BaseException as e:
+            if not ctx1.__exit__(type(e), e, e.__traceback__):
                 raise
         else:
             ctx1.__exit__(None, None, None)
-    except BaseException:
-        if not ctx0.__exit__(*sys.exc_info()):
+    except BaseException as e:
+        if not ctx0.__exit__(type(e), e, e.__traceback__):
             raise
     else:
         ctx0.__exit__(None, None, None)
+
+
+# Indexed by the number of the context managers
+_DUNDER_TABLE: tuple[
+    Callable[[Sequence[GenCtxMngr[Any]]], GenCtxMngr[list[Any]]], ...
+] = (
+    dunder_enter_null,
+    dunder_enter_single,
+    dunder_enter_double,
+    dunder_enter_triple,
+    dunder_enter_quadruple,
+)
@@ -1,13 +1,37 @@
 import contextlib
-from collections.abc import Generator, Sequence
-from typing import Any, TypeVar
+from collections.abc import Iterable
+from typing import Any, Generic, Optional, TypeVar
 
 from apluggy.stack import GenCtxMngr
 
 T = TypeVar('T')
 
 
-@contextlib.contextmanager
-def exit_stack(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    with contextlib.ExitStack() as stack:
-        yield [stack.enter_context(ctx) for ctx in ctxs]
+def exit_stack(ctxs: Iterable[GenCtxMngr[T]]) -> '_ExitStack[T]':
+    return _ExitStack(ctxs)
+
+
+class _ExitStack(Generic[T]):
+    '''Enter `ctxs` in an `ExitStack` without a generator in between.
+
+    It doesn't have the `gen` attribute, so it is only usable without sends.
+    '''
+
+    # Assigned by `__enter__()`.
+    _stack: contextlib.ExitStack
+
+    def __init__(self, ctxs: Iterable[GenCtxMngr[T]]) -> None:
+        self._ctxs = ctxs
+
+    def __enter__(self) -> list[T]:
+        # Exit the contexts already entered if entering one of them raises.
+        with contextlib.ExitStack() as stack:
+            ys = [stack.enter_context(ctx) for ctx in self._ctxs]
+            self._stack = stack.pop_all()
+            return ys
+        # One of the entered contexts suppressed the exception. A generator
+        # based stack ends without yielding in this case.
+        raise RuntimeError("generator didn't yield")
+
+    def __exit__(self, *exc_info: Any) -> Optional[bool]:
+        return self._stack.__exit__(*exc_info)
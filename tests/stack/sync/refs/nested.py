@@ -1,5 +1,5 @@
 import contextlib
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Sequence
 from typing import Any, TypeVar
 
 from apluggy.stack import GenCtxMngr
@@ -9,101 +9,86 @@ T = TypeVar('T')
 
 def nested_with(ctxs: Iterable[GenCtxMngr[T]]) -> GenCtxMngr[list[T]]:
     ctxs = list(ctxs)
-    # TODO: When Python 3.9 support is dropped
-    # match len(ctxs):
-    #     case 0:
-    #         return nested_with_null(ctxs)
-    #     case 1:
-    #         return nested_with_single(ctxs)
-    #     case 2:
-    #         return nested_with_double(ctxs)
-    #     case 3:
-    #         return nested_with_triple(ctxs)
-    #     case 4:
-    #         return nested_with_quadruple(ctxs)
-    #     case _:
-    #         raise NotImplementedError()
-    if not ctxs:
-        return nested_with_null(ctxs)
-    if len(ctxs) == 1:
-        return nested_with_single(ctxs)
-    if len(ctxs) == 2:
-        return nested_with_double(ctxs)
-    if len(ctxs) == 3:
-        return nested_with_triple(ctxs)
-    if len(ctxs) == 4:
-        return nested_with_quadruple(ctxs)
-    raise NotImplementedError()
+    n = len(ctxs)
+    if n >= len(_NESTED_TABLE):
+        raise NotImplementedError()
+    return _NESTED_TABLE[n](ctxs)
 
 
 @contextlib.contextmanager
-def nested_with_null(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    assert not ctxs
+def nested_with_null(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack no context managers; `ctxs` must be empty.'''
     yield []
 
 
 @contextlib.contextmanager
-def nested_with_single(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 1
+def nested_with_single(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack `ctxs`, which must hold exactly one context manager.'''
     ctx = ctxs[0]
     with ctx as y:
+        send = ctx.gen.send
         sent = yield [y]
         try:
             while True:
-                sent = yield [ctx.gen.send(sent)]
+                sent = yield [send(sent)]
         except StopIteration:
             pass
 
 
 @contextlib.contextmanager
-def nested_with_double(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 2
+def nested_with_double(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack `ctxs`, which must hold exactly two context managers.'''
     ctx0, ctx1 = ctxs
     with ctx0 as y0, ctx1 as y1:
+        send0, send1 = ctx0.gen.send, ctx1.gen.send
         sent = yield [y0, y1]
         try:
             while True:
-                sent = yield [ctx1.gen.send(sent), ctx0.gen.send(sent)]
+                sent = yield [send1(sent), send0(sent)]
         except StopIteration:
             pass
 
 
 @contextlib.contextmanager
-def nested_with_triple(ctxs: Iterable[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 3
+def nested_with_triple(ctxs: Sequence[GenCtxMngr[T]]) -> Generator[list[T], Any, Any]:
+    '''Stack `ctxs`, which must hold exactly three context managers.'''
     ctx0, ctx1, ctx2 = ctxs
     with ctx0 as y0, ctx1 as y1, ctx2 as y2:
+        send0, send1, send2 = ctx0.gen.send, ctx1.gen.send, ctx2.gen.send
         sent = yield [y0, y1, y2]
         try:
             while True:
-                sent = yield [
-                    ctx2.gen.send(sent),
-                    ctx1.gen.send(sent),
-                    ctx0.gen.send(sent),
-                ]
+                sent = yield [send2(sent), send1(sent), send0(sent)]
         except StopIteration:
             pass
 
 
 @contextlib.contextmanager
 def nested_with_quadruple(
-    ctxs: Iterable[GenCtxMngr[T]],
+    ctxs: Sequence[GenCtxMngr[T]],
 ) -> Generator[list[T], Any, Any]:
-    ctxs = list(ctxs)
-    assert len(ctxs) == 4
+    '''Stack `ctxs`, which must hold exactly four context managers.'''
     ctx0, ctx1, ctx2, ctx3 = ctxs
     with ctx0 as y0, ctx1 as y1, ctx2 as y2, ctx3 as y3:
+        send0 = ctx0.gen.send
+        send1 = ctx1.gen.send
+        send2 = ctx2.gen.send
+        send3 = ctx3.gen.send
         sent = yield [y0, y1, y2, y3]
         try:
             while True:
-                sent = yield [
-                    ctx3.gen.send(sent),
-                    ctx2.gen.send(sent),
-                    ctx1.gen.send(sent),
-                    ctx0.gen.send(sent),
-                ]
+                sent = yield [send3(sent), send2(sent), send1(sent), send0(sent)]
         except StopIteration:
             pass
+
+
+# Indexed by the number of the context managers
+_NESTED_TABLE: tuple[
+    Callable[[Sequence[GenCtxMngr[Any]]], GenCtxMngr[list[Any]]], ...
+] = (
+    nested_with_null,
+    nested_with_single,
+    nested_with_double,
+    nested_with_triple,
+    nested_with_quadruple,
+)
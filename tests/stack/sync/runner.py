@@ -12,6 +12,13 @@ from .refs import Stack
 
 T = TypeVar('T')
 
+# Strategies are built once and reused by every draw.
+_ST_INIT_RAISE = st.booleans()
+_ST_CTX_ACTION = st.one_of(st.none(), st.sampled_from(['raise', 'break']))
+_ST_EXCEPT_ACTION = st.sampled_from(['reraise', 'raise', 'suppress'])
+_ST_EXIT_ACTION = st.sampled_from(['reraise', 'suppress'])
+_ST_WITH_ACTION = st.sampled_from(['send', 'throw', 'close'])
+
 
 def run(
     draw: st.DrawFn, stack: Stack[T], n_contexts, n_sends: int
@@ -54,7 +61,7 @@ def mock_context(
 ) -> Generator[Any, Any, Any]:
     probe(id, 'init', f'n_sends={n_sends}')
 
-    if draw(st.booleans()):
+    if draw(_ST_INIT_RAISE):
         exc = Raised(f'{id}-init')
         probe(id, 'raise', f'{exc!r}')
         raise exc
@@ -69,7 +76,7 @@ def mock_context(
         for i in range(n_sends):
             ii = f'{i+1}/{n_sends}'
 
-            action = draw(st.one_of(st.none(), st.sampled_from(['raise', 'break'])))
+            action = draw(_ST_CTX_ACTION)
             if action == 'raise':
                 exc = Raised(f'{id}-{ii}')
                 probe(id, ii, 'raise', f'{exc!r}')
@@ -87,14 +94,20 @@ def mock_context(
         # This can happen after the test has finished unless close() is called
         # in the test.
         probe(id, 'caught', e)
-        raise
+        # Returning instead of re-raising suppresses the exception. __exit__()
+        # never calls close(). It throws GeneratorExit in here with gen.throw()
+        # after the stack around this context was closed.
+        if draw(_ST_EXIT_ACTION) == 'reraise':
+            probe(id, 'reraise')
+            raise
+        probe(id, 'suppress')
     except BaseException as e:  # throw() was called or exception raised
         # throws() might be called by __exit__(). If so, an exception must be
         # raised here, otherwise __exit__() will raise
         # RuntimeError("generator didn't stop after throw()")
         probe(id, 'caught', e)
         # action = draw(st.one_of(st.none(), st.sampled_from(['reraise', 'raise'])))
-        action = draw(st.sampled_from(['reraise', 'raise']))
+        action = draw(_ST_EXCEPT_ACTION)
         if action == 'reraise':
             probe(id, 'reraise')
             raise
@@ -102,6 +115,8 @@ def mock_context(
             exc = Raised(f'{id}-except')
             probe(id, 'raise', f'{exc!r}')
             raise exc
+        elif action == 'suppress':
+            probe(id, 'suppress')
     finally:
         probe(id, 'finally')
 
@@ -124,7 +139,7 @@ def run_generator_context(
             raise exc
         for i in range(n_sends):
             ii = f'{i+1}/{n_sends}'
-            action = draw(st.sampled_from(['send', 'throw', 'close']))
+            action = draw(_ST_WITH_ACTION)
             try:
                 # TODO: When Python 3.9 support is dropped
                 # match action:
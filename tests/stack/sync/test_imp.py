@@ -9,7 +9,7 @@ from .runner import run
 
 
 @given(st.data())
-@settings(max_examples=200, deadline=1000)
+@settings(deadline=1000)
 def test_imp(data: st.DataObject):
     '''Compare with reference implementations.'''
     n_contexts = data.draw(st.integers(min_value=0, max_value=4), label='n_contexts')
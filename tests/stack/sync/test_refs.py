@@ -1,48 +1,57 @@
+from collections.abc import Sequence
+from typing import Any
+
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from tests.utils import RecordReturns, ReplayReturns
 
-from .refs import dunder_enter, exit_stack, nested_with
+from .refs import Stack, dunder_enter, exit_stack, nested_with
 from .runner import run
 
 
 @given(st.data())
-@settings(max_examples=200, deadline=1000)
+@settings(deadline=1000)
 def test_refs(data: st.DataObject):
     '''Assert reference implementations run in exactly the same way.'''
     n_contexts = data.draw(st.integers(min_value=0, max_value=4), label='n_contexts')
 
-    n_sends = data.draw(st.integers(min_value=0, max_value=4), label='n_sends')
-    draw = RecordReturns(data.draw)
+    n_sends = data.draw(st.integers(min_value=1, max_value=4), label='n_sends')
 
-    # Run on nested-with implementation.
-    probe0, yields0 = run(
-        draw=draw, stack=nested_with, n_contexts=n_contexts, n_sends=n_sends
-    )
+    # Run on nested-with implementation, verify the replay draw by running on
+    # the same implementation, and compare with manual enter/exit
+    # implementation.
+    stacks: list[Stack[Any]] = [nested_with, nested_with, dunder_enter]
+    assert_same_runs(data, stacks, n_contexts=n_contexts, n_sends=n_sends)
 
-    # Verify the replay draw by running on the same implementation.
-    replay = ReplayReturns(draw)
-    probe1, yields1 = run(
-        draw=replay, stack=nested_with, n_contexts=n_contexts, n_sends=n_sends
-    )
 
-    assert probe0.calls == probe1.calls
-    assert yields0 == yields1
+@given(st.data())
+@settings(max_examples=20, deadline=1000)  # A small space without sends
+def test_refs_no_sends(data: st.DataObject):
+    '''Assert reference implementations and ExitStack run in the same way
+    without sends.
+    '''
+    n_contexts = data.draw(st.integers(min_value=0, max_value=4), label='n_contexts')
+
+    # Run on nested-with implementation, verify the replay draw by running on
+    # the same implementation, and compare with manual enter/exit
+    # implementation and with ExitStack, which doesn't support send.
+    stacks: list[Stack[Any]] = [nested_with, nested_with, dunder_enter, exit_stack]
+    assert_same_runs(data, stacks, n_contexts=n_contexts, n_sends=0)
 
-    # Compare with manual enter/exit implementation.
-    replay = ReplayReturns(draw)
-    probe1, yields1 = run(
-        draw=replay, stack=dunder_enter, n_contexts=n_contexts, n_sends=n_sends
-    )
-    assert probe0.calls == probe1.calls
-    assert yields0 == yields1
 
-    # Compare with ExitStack, which doesn't support send.
-    if n_sends == 0:
-        replay = ReplayReturns(draw)
+def assert_same_runs(
+    data: st.DataObject, stacks: Sequence[Stack[Any]], n_contexts: int, n_sends: int
+) -> None:
+    '''Run on `stacks[0]` and assert the rest replay the same draws identically.'''
+    record = RecordReturns(data.draw)
+    probe0, yields0 = run(
+        draw=record, stack=stacks[0], n_contexts=n_contexts, n_sends=n_sends
+    )
+    for stack in stacks[1:]:
+        replay = ReplayReturns(record)
         probe1, yields1 = run(
-            draw=replay, stack=exit_stack, n_contexts=n_contexts, n_sends=n_sends
+            draw=replay, stack=stack, n_contexts=n_contexts, n_sends=n_sends
         )
         assert probe0.calls == probe1.calls
         assert yields0 == yields1
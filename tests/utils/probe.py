@@ -1,4 +1,3 @@
-import inspect
 import sys
 from typing import Any, TypeVar
 
@@ -40,12 +39,16 @@ class Probe:
 
     '''
 
+    __slots__ = ('calls',)
+
     def __init__(self) -> None:
         self.calls = list[str]()
 
     def __call__(self, *tags: Any) -> None:
-        frame = inspect.stack()[1]
-        location = f'{frame.filename}:{frame.lineno}'
+        # `inspect.stack()` would build frame info with source context for the
+        # entire stack. Only the caller's frame is needed.
+        frame = sys._getframe(1)
+        location = f'{frame.f_code.co_filename}:{frame.f_lineno}'
         fmt_tags = '{' + ','.join(self._fmt_tag(t) for t in tags) + '}'
         record = ':'.join([location, fmt_tags])
         self.calls.append(record)
@@ -1,6 +1,5 @@
 import inspect
 import sys
-from collections import deque
 from collections.abc import Callable
 from typing import Generic, Optional, TypeVar
 
@@ -48,11 +47,14 @@ class ReplayReturns(Generic[P, T]):
     '''Repeat the return values of a function that were recorded by RecordReturns.'''
 
     def __init__(self, record: RecordReturns[P, T]):
-        self.returns = deque(record.returns)
+        self.returns = tuple(record.returns)
+        self._next = 0
 
     # To conform st.DrawFn
     __signature__ = inspect.Signature(parameters=[])
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         del args, kwargs
-        return self.returns.popleft()
+        ret = self.returns[self._next]
+        self._next += 1
+        return ret